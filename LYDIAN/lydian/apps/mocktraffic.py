@@ -6,13 +6,11 @@
 
 import logging
 import os
-import queue
 import threading
-import time
 
 
 from lydian.apps.base import BaseApp, exposify
-from lydian.traffic.core import TrafficRecord, TrafficRule
+from lydian.traffic.core import TrafficRule, get_record_pool
 from lydian.utils.common import get_mgmt_ifname
 from lydian.utils.network_utils import InterfaceManager
 
@@ -34,6 +32,7 @@ class MockTraffic(BaseApp):
         self._stop_switch.set()  # Stopped until started.
         self._thread = None
         self._dummy_rule = {}
+        self._record_pool = get_record_pool()
 
         # Host is where this app is running. Based on host,
         # it is decided for a rule if we need to run a client
@@ -58,17 +57,21 @@ class MockTraffic(BaseApp):
             log.info("Registered traffic : %r", rule.ruleid)
 
     def ping(self):
-        while not self._stop_switch.is_set():
+        # Waiting on stop switch (instead of sleeping) lets stop() wake
+        # this thread up right away.
+        while not self._stop_switch.wait(self._interval):
             # Put logic for running traffic here. 
             # Process the response and create Traffic Record
             # like below and put on the queue. It will be pushed
             # onto corresponding databases.
+            if not self._rqueue.accepting:
+                continue    # All the recorders are disabled.
 
             for ruleid, trule in self._dummy_rule.items():
                 # as an example, create dummy records for each ruleid
                 # asked to be handled by this tool.
+                rec = self._record_pool.acquire()
                 try:
-                    rec = TrafficRecord()
                     rec.source = '0.0.0.0'
                     rec.destination = '0.0.0.0'
                     rec.protocol = 'TCP'
@@ -77,16 +80,12 @@ class MockTraffic(BaseApp):
                     rec.reqid = trule.reqid
                     rec.ruleid = ruleid
                     rec.latency = '0'
-                    self._rqueue.put(rec, block=False, timeout=2)
                     log.info("Traffic: %r", rec)
-                except queue.Full as err:
-                    log.error("Cann't put Traffic Record %r into the queue: %r",
-                            rec, err)
+                    # Drops the oldest record, if queue is full.
+                    self._rqueue.put(rec)
                 except Exception as err:
                     log.error("Error in puytting dummy records %r ",err)
 
-            time.sleep(self._interval)
-
     def is_running(self):
         """
         Returns True if Rescoures are being monitored else False.
@@ -9,7 +9,6 @@
 """
 import logging
 import os
-import queue
 import threading
 import time
 
@@ -48,6 +47,11 @@ class ResourceMonitor(BaseApp):
     def _run(self):
         p = psutil.Process(os.getpid())
         while not self._stop_switch.is_set():
+            if not self._rqueue.accepting:
+                # Resource recording is disabled.
+                time.sleep(self._interval)
+                continue
+
             sys_cpu_percent = round(psutil.cpu_percent(), 2)
             sys_mem_percent = round(psutil.virtual_memory().percent, 2)
             sys_net_conns = int(len(psutil.net_connections()))
@@ -60,11 +64,8 @@ class ResourceMonitor(BaseApp):
                                  sys_net_conns,
                                  lydian_cpu_percent, lydian_mem_percent,
                                  lydian_net_conns)
-            try:
-                self._rqueue.put(rec, block=False, timeout=2)
-            except queue.Full:
-                log.error("Cann't put Resource record %r into the queue.",
-                          rec)
+            # Drops the oldest record, if queue is full.
+            self._rqueue.put(rec)
 
             time.sleep(self._interval)
 
@@ -7,19 +7,22 @@
 import collections
 import itertools
 import logging
-import pickle
-import queue
-
+import threading
 import time
 import uuid
 
+from concurrent.futures import ThreadPoolExecutor
+
+import msgpack
+
 from lydian.apps import rules
 from lydian.apps import config
 from lydian.apps.base import BaseApp, exposify
 from lydian.apps.internal.setup import SetupInfo
 from lydian.apps.monitor import ResourceMonitor
 from lydian.apps.recorder import RecordManager
-from lydian.controller.client import LydianClient
+from lydian.common.fifo import CircularFifoQueue
+from lydian.controller.client import LydianClient, LydianClientPool
 from lydian.traffic.core import TrafficRule
 from lydian.utils.prep import prep_node, cleanup_node
 from lydian.utils.parallel import ThreadPool
@@ -31,6 +34,22 @@ log = logging.getLogger(__name__)
 
 _podium = None
 
+# fields (tuple of column names) -> row type for traffic results.
+_row_types = {}
+
+
+def _get_row_type(fields):
+    """
+    Returns namedtuple type for traffic result rows with given fields.
+    Rows stay tuples; use row._asdict() to get them as dict.
+    """
+    row_type = _row_types.get(fields)
+    if row_type is None:
+        row_type = collections.namedtuple('TrafficResult', fields,
+                                          rename=True)
+        row_type = _row_types.setdefault(fields, row_type)
+    return row_type
+
 
 def _get_host_ip(host, func_ip=None):
 
@@ -52,6 +71,8 @@ class Podium(BaseApp):
     NAMESPACE_INTERFACE_NAME_PREFIXES = config.get_param('NAMESPACE_INTERFACE_NAME_PREFIXES')
     NODE_PREP_MAX_THREAD = config.get_param('NODE_PREP_MAX_THREAD')
     MAX_QUEUE_SIZE = 50000
+    HOST_POLL_MIN_INTERVAL = 0.5    # first backoff between host probes.
+    HOST_POLL_MAX_INTERVAL = 4.0    # cap on backoff between host probes.
 
     def __init__(self, username=None, password=None, db_file=None):
         """
@@ -60,6 +81,8 @@ class Podium(BaseApp):
         """
         self._primary = True
         self._ep_hosts = {}
+        # str.startswith() checks all the prefixes at once given a tuple.
+        self._ns_prefixes = tuple(self.NAMESPACE_INTERFACE_NAME_PREFIXES)
         self._ep_username = username or config.get_param('ENDPOINT_USERNAME')
         self._ep_password = password or config.get_param('ENDPOINT_PASSWORD')
         self.rules_app = rules.RulesApp()
@@ -70,6 +93,19 @@ class Podium(BaseApp):
         self.db_pool = None
         self.nodes = set()
 
+        # Events of ongoing waits on hosts, set by cancel_wait.
+        self._waits = set()
+        self._waits_lock = threading.Lock()
+
+        # Threads for fanning out operations to hosts. Created on first
+        # use and kept till close() to save thread setup on every
+        # operation.
+        self._executor = None
+        self._executor_lock = threading.Lock()
+
+        # Connections to hosts, reused across operations.
+        self._clients = LydianClientPool()
+
         # Update config file based on default constants, config file
         # and any previously set configs (in .db file). In that order.
         config.update_config()
@@ -114,19 +150,53 @@ class Podium(BaseApp):
         config.get_configs().cleanup()
 
     def close(self):
+        self.cancel_wait()
         if self.monitor:
             self.monitor.stop()
         if self.db_pool:
             self.db_pool.stop()
+        with self._executor_lock:
+            executor, self._executor = self._executor, None
+        if executor:
+            executor.shutdown(wait=True)
+        self._clients.close()
+
+    def close_clients(self, hostips=None):
+        """
+        Closes cached connections to hostips (all the hosts, if None).
+        """
+        self._clients.discard(hostips)
+
+    def _get_executor(self):
+        with self._executor_lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self.NODE_PREP_MAX_THREAD,
+                    thread_name_prefix='podium')
+            return self._executor
+
+    def _fanout(self, func, params):
+        """
+        Runs func for each of (ident, args, kwargs) in params in Podium's
+        threads and returns results as <ident: result> dictionary.
+
+        Meant for short RPC operations only. Long running ones (host prep
+        / cleanup) would hold up every other operation, so use a
+        ThreadPool of their own. func must not call _fanout itself, as
+        it could wait forever on threads busy running its callers.
+        """
+        return ThreadPool(func, params, executor=self._get_executor())
 
     def start_primary_monitor(self):
         """
         Start Monitoring on Primary node.
         """
         if not self.traffic_records:
-            self.traffic_records = queue.Queue(self.MAX_QUEUE_SIZE)
+            self.traffic_records = CircularFifoQueue(
+                self.MAX_QUEUE_SIZE, mode=CircularFifoQueue.OVERWRITE)
         if not self.resource_records:
-            self.resource_records = queue.Queue(self.MAX_QUEUE_SIZE)
+            self.resource_records = CircularFifoQueue(
+                self.MAX_QUEUE_SIZE, mode=CircularFifoQueue.OVERWRITE)
         if not self.monitor:
             self.monitor = ResourceMonitor(self.resource_records)
         if not self.db_pool:
@@ -137,23 +207,64 @@ class Podium(BaseApp):
         if self.db_pool.stopped():
             self.db_pool.start()
 
+    def get_dropped_records(self, hostip=None):
+        """
+        Returns (traffic, resource) count of records dropped at hostip
+        because its recorders fell behind. Returns counts for primary
+        node if hostip is None.
+        """
+        if hostip is None:
+            return self.db_pool.dropped_records() if self.db_pool else (0, 0)
+
+        return self._clients.call(
+            hostip, lambda client: client.results.dropped_records())
+
     def is_host_up(self, hostip):
         try:
-            with LydianClient(hostip) as client:
-                client.monitor.is_running()
+            self._clients.call(hostip,
+                               lambda client: client.monitor.is_running())
             return True
         except Exception:
             return False
 
     def wait_on_host(self, hostip, wait_time=None):
+        """
+        Waits for Lydian service at hostip to come up. Host is probed with
+        exponential backoff between the tries. Returns True if host came
+        up within wait_time seconds else False (also when wait is
+        cancelled through cancel_wait).
+        """
         wait_time = wait_time or self.HOST_WAIT_TIME
-        et = int(time.time() + wait_time)
+        et = time.time() + wait_time
+        interval = self.HOST_POLL_MIN_INTERVAL
 
-        while time.time() < et:
-            if self.is_host_up(hostip):
-                return True
-
-        return False
+        cancelled = threading.Event()
+        with self._waits_lock:
+            self._waits.add(cancelled)
+        try:
+            while True:
+                if self.is_host_up(hostip):
+                    return True
+
+                remaining = et - time.time()
+                if remaining <= 0:
+                    return False
+                if cancelled.wait(timeout=min(interval, remaining)):
+                    log.info("Wait on host %s cancelled.", hostip)
+                    return False
+                interval = min(interval * 2, self.HOST_POLL_MAX_INTERVAL)
+        finally:
+            with self._waits_lock:
+                self._waits.discard(cancelled)
+
+    def cancel_wait(self):
+        """
+        Interrupts the ongoing waits on hosts. Waits started afterwards
+        are not affected.
+        """
+        with self._waits_lock:
+            for cancelled in self._waits:
+                cancelled.set()
 
     def update_endpoints(self, iface_hosts):
         """
@@ -176,16 +287,17 @@ class Podium(BaseApp):
             self._ep_hosts.pop(ep)
 
     def _add_endpoints(self, client, hostip):
+        ep_hosts = self._ep_hosts
+        ns_prefixes = self._ns_prefixes
         for iface, ips in client.interface.get_interface_ips_map().items():
-            if not any([iface.startswith(x) for x in
-                        self.NAMESPACE_INTERFACE_NAME_PREFIXES]):
+            if not iface.startswith(ns_prefixes):
                 continue
             for ip in ips:
-                self._ep_hosts[ip] = hostip
+                ep_hosts[ip] = hostip
 
         # Fetch Namespace Interfaces
         for ip in client.namespace.list_namespaces_ips():
-            self._ep_hosts[ip] = hostip
+            ep_hosts[ip] = hostip
 
     def add_endpoints(self, hostip, username=None, password=None):
         """
@@ -199,9 +311,8 @@ class Podium(BaseApp):
         password = password or self._ep_password
 
         try:
-            with LydianClient(hostip) as client:
-                # fetch regular interfaces
-                self._add_endpoints(client, hostip)
+            # fetch regular interfaces
+            self._clients.call(hostip, self._add_endpoints, hostip)
 
             self._ep_hosts[hostip] = hostip
 
@@ -247,6 +358,8 @@ class Podium(BaseApp):
             hostips = hostips.split(',')
         args = [(host, (host, username, password, fetch_iface), {})
                 for host in hostips]
+        # Host prep runs for long. Own pool keeps it from holding up
+        # Podium's threads (see _fanout).
         return ThreadPool(self.add_host, args)
 
     def cleanup_hosts(self, hostips, username=None, password=None,
@@ -269,12 +382,13 @@ class Podium(BaseApp):
             hostips = hostips.split(',')
         args = [(host, (host, username, password), {'remove_db': remove_db})
                 for host in hostips]
-        results = ThreadPool(cleanup_node, args)
+        results = ThreadPool(cleanup_node, args)   # long running, own pool.
 
         # Remove all IPs cached in self._ep_hosts for hosts that have
         # successfully cleaned up
         for host_ip, result in results.items():
             if result:
+                self.close_clients([host_ip])
                 self.remove_endpoints(host_ip)
                 if host_ip in self.nodes:
                     self.nodes.remove(host_ip)
@@ -306,8 +420,16 @@ class Podium(BaseApp):
         for key, value in intent.items():
             setattr(trule, key, value)
         trule.fill()
+        # Resolve hosts once so as operations on the rule don't have to.
+        trule.src_host = self._ep_hosts.get(trule.src)
+        trule.dst_host = self._ep_hosts.get(trule.dst)
         return trule
 
+    def get_rule_src_host(self, trule):
+        """ Returns management IP of host running client for trule. """
+        # Rules registered by older versions may not have src_host.
+        return getattr(trule, 'src_host', None) or self.get_ep_host(trule.src)
+
     def run_traffic(self, src_ip, dst_ip, dst_port, protocol,
                     connected=True, duration=-1):
         _intent = self.create_traffic_intent(src_ip, dst_ip, dst_port,
@@ -322,13 +444,11 @@ class Podium(BaseApp):
     def run_mesh_ping(self, hosts, dst_port, protocol, connected=True,
                       duration=-1):
         reqid = '%s' % uuid.uuid4()
-        host_pairs = list(itertools.permutations(hosts, 2))
-        intents = []
-        for src, dst in host_pairs:
-            intents.append(self.create_traffic_intent(src, dst, dst_port,
-                                                      protocol,
-                                                      connected=connected,
-                                                      reqid=reqid))
+        # Intents are generated lazily as register_traffic consumes them.
+        intents = (self.create_traffic_intent(src, dst, dst_port, protocol,
+                                              connected=connected,
+                                              reqid=reqid)
+                   for src, dst in itertools.permutations(hosts, 2))
         self.register_traffic(intents)
         if duration > 0:
             time.sleep(duration)
@@ -342,33 +462,32 @@ class Podium(BaseApp):
 
         Parameters
         -----------
-        intent : collection (list)
-            List of rules to register.
+        intent : iterable
+            Rules to register. Consumed only once, so a generator is
+            fine too.
         """
         servers = collections.defaultdict(list)
         clients = collections.defaultdict(list)
         _trules = []
+        servers_first = config.get_param('TRAFFIC_START_SERVERS_FIRST')
         for rule in intent:
-            srchost = self.get_ep_host(rule['src'])
-            dsthost = self.get_ep_host(rule['dst'])
+            trule = self.create_traffic_rule(rule)
 
-            if not srchost:
+            if not trule.src_host:
                 log.error("No host found for running traffic from IP : %s",
-                          rule['src'])
+                          trule.src)
                 continue
-            elif not dsthost:
+            elif not trule.dst_host:
                 log.error("No host found for running traffic from IP : %s",
-                          rule['dst'])
+                          trule.dst)
                 continue
 
-            servers[dsthost].append(rule)
-            clients[srchost].append(rule)
-
-            trule = self.create_traffic_rule(rule)
+            servers[trule.dst_host].append(rule)
+            clients[trule.src_host].append(rule)
             _trules.append(trule)
 
         # Register at endpoint and create local representation.
-        if config.get_param('TRAFFIC_START_SERVERS_FIRST'):
+        if servers_first:
             # Start Servers first and then Clients.
             host_rules_map = [servers, clients]
         else:
@@ -380,49 +499,48 @@ class Podium(BaseApp):
             host_rules_map = [servers]
 
         def _register_traffic_rules(host, rules):
-            with LydianClient(host) as dclient:
-                dclient.controller.register_traffic(rules)
+            self._clients.call(
+                host, lambda client: client.controller.register_traffic(rules))
 
         # Start Server before the client.
         for host_rules in host_rules_map:
             collection = [(host, (host, rules), {})
                           for host, rules in host_rules.items()]
-            ThreadPool(_register_traffic_rules, collection)
+            self._fanout(_register_traffic_rules, collection)
 
         self.rules_app.add_rules(_trules)  # Persist rules to local db
 
     def _traffic_op(self, reqid, op_type):
 
         def _start_traffic(hostip, rules):
-            with LydianClient(hostip) as client:
-                client.controller.start(rules)
+            self._clients.call(
+                hostip, lambda client: client.controller.start(rules))
 
         def _stop_traffic(hostip, rules):
-            with LydianClient(hostip) as client:
-                client.controller.stop(rules)
+            self._clients.call(
+                hostip, lambda client: client.controller.stop(rules))
+
+        def _unregister(client, rules):
+            client.controller.unregister_traffic(rules)
+            client.results.delete_record(reqid)
 
         def _unregister_traffic(hostip, rules):
-            with LydianClient(hostip) as client:
-                client.controller.unregister_traffic(rules)
-                client.results.delete_record(reqid)
+            self._clients.call(hostip, _unregister, rules)
 
         trules = self.get_rules_by_reqid(reqid)
 
         host_rules = collections.defaultdict(list)
         for trule in trules:
-            ruleid = getattr(trule, 'ruleid')
-            src_ip = getattr(trule, 'src')
-            hostip = self.get_ep_host(src_ip)
-            host_rules[hostip].append(ruleid)
+            host_rules[self.get_rule_src_host(trule)].append(trule.ruleid)
 
         args = [(host, (host, rules), {})
                 for host, rules in host_rules.items()]
         if op_type == 'start':
-            return ThreadPool(_start_traffic, args)
+            return self._fanout(_start_traffic, args)
         elif op_type == 'stop':
-            return ThreadPool(_stop_traffic, args)
+            return self._fanout(_stop_traffic, args)
         elif op_type == 'unregister':
-            return ThreadPool(_unregister_traffic, args)
+            return self._fanout(_unregister_traffic, args)
 
     def start_traffic(self, reqid):
         return self._traffic_op(reqid, op_type='start')
@@ -433,63 +551,90 @@ class Podium(BaseApp):
     def unregister_traffic(self, reqid):
         """ Stop traffic, delete rules and result records"""
         results = self._traffic_op(reqid, op_type='unregister')
-        self.rules_app.delete(reqid=reqid)
+        self.rules_app.delete_rules_by_reqid(reqid)
         return results
 
     def get_rules_by_reqid(self, reqid):
-        trules = [trule for rule_id, trule in self.rules.items()
-                  if getattr(trule, 'reqid') == reqid]
-        return trules
+        return self.rules_app.get_rules_by_reqid(reqid)
+
+    def _get_query_window(self, duration):
+        """
+        Returns range of timestamp field for records of last duration
+        seconds.
+        """
+        latency = config.get_param('TRAFFIC_STATS_QUERY_LATENCY')
+        current_time = int(time.time()) - latency
+        return (str(current_time - duration), str(current_time))
 
     def get_host_result(self, host_ip, reqid, duration=None, **kwargs):
         if duration is not None:
-            # Creating a tuple of range for timestamp field
-            latency = config.get_param('TRAFFIC_STATS_QUERY_LATENCY')
-            current_time = int(time.time()) - latency
-            kwargs['timestamp'] = (str(current_time - duration), str(current_time))
+            kwargs['timestamp'] = self._get_query_window(duration)
 
-        results = []
+        payload = self._clients.call(
+            host_ip, lambda client: client.results.traffic(reqid, **kwargs))
 
-        with LydianClient(host_ip) as client:
-            results = pickle.loads(client.results.traffic(reqid, **kwargs))
-
-        return results
+        payload = msgpack.unpackb(payload, raw=False, use_list=False)
+        row_type = _get_row_type(payload['fields'])
+        return [row_type._make(row) for row in payload['rows']]
 
     def _get_results(self, hostips, reqid, duration=None, **kwargs):
         results = []
-        workers = self.NODE_PREP_MAX_THREAD
 
         args = [(host, (host, reqid, duration), kwargs) for host in hostips]
-        _results = ThreadPool(self.get_host_result, args, workers=workers)
+        _results = self._fanout(self.get_host_result, args)
         for _, val in _results.items():
             results.extend(val)
 
         return results
 
-    def get_results(self, reqid, duration=None, **kwargs):
+    def _get_result_hosts(self, reqid):
+        """ Returns hosts holding traffic records for reqid. """
         trules = self.get_rules_by_reqid(reqid)
-        hostips = set([self.get_ep_host(rule.src)
-                      for rule in trules if rule.src])
+        return {self.get_rule_src_host(rule) for rule in trules if rule.src}
+
+    def get_results(self, reqid, duration=None, **kwargs):
+        hostips = self._get_result_hosts(reqid)
         results = self._get_results(hostips, reqid, duration=duration,
                                     **kwargs)
         return results
 
-    def get_traffic_stats(self, reqid, duration=None, **kwargs):
-        stats = {'success': 0,
-                 'failure': 0}
+    def get_host_histogram(self, host_ip, reqid, duration=None, **kwargs):
+        """
+        Returns {'1': success count, '0': failure count} of records for
+        reqid at host_ip.
+        """
+        if duration is not None:
+            kwargs['timestamp'] = self._get_query_window(duration)
+
+        histogram = collections.Counter()
+        pairs = self._clients.call(
+            host_ip,
+            lambda client: client.results.result_histogram(reqid, **kwargs))
+        for result, count in pairs:
+            histogram[str(result)] += count or 0
+        return histogram
+
+    def _get_histograms(self, hostips, reqid, duration=None, **kwargs):
+        """ Returns result histogram for reqid, summed across hosts. """
+        args = [(host, (host, reqid, duration), kwargs) for host in hostips]
+        histograms = self._fanout(self.get_host_histogram, args)
+        total = collections.Counter()
+        for histogram in histograms.values():
+            if histogram:
+                total.update(histogram)
+        return total
 
+    def get_traffic_stats(self, reqid, duration=None, **kwargs):
         _ = kwargs.pop('result', None)
-        pass_records = self.get_results(reqid, duration=duration, result='1',
-                                        **kwargs)
-        fail_records = self.get_results(reqid, duration=duration, result='0',
-                                        **kwargs)
-
-        for host_pass_record in pass_records:
-            stats['success'] += len(host_pass_record)
-
-        for host_fail_record in fail_records:
-            stats['failure'] += len(host_fail_record)
-
+        hostips = self._get_result_hosts(reqid)
+
+        # Records are counted per result at hosts, in a single call.
+        histogram = self._get_histograms(hostips, reqid, duration=duration,
+                                         **kwargs)
+        stats = {
+            'success': histogram['1'],
+            'failure': histogram['0']
+            }
         return stats
 
     def get_traffic_pass_percent(self, reqid, duration=None, **kwargs):
@@ -504,59 +649,68 @@ class Podium(BaseApp):
 
     def get_param(self, host_ip, param):
         host_ip = self.get_ep_host(host_ip)
-        with LydianClient(host_ip) as client:
-            return client.configs.get_param(param)
+        return self._clients.call(
+            host_ip, lambda client: client.configs.get_param(param))
 
     def set_param(self, host_ip, param, val):
         host_ip = self.get_ep_host(host_ip)
-        with LydianClient(host_ip) as client:
-            client.configs.set_param(param, val)
-
-    def get_host_latency(self, host_ip, reqid, method, duration=None,
-                         **kwargs):
-        result = 0
-        with LydianClient(host_ip) as client:
-            current_time = time.time()
-            if duration is not None:
-                # Creating a tuple of range for timestamp field
-                kwargs['timestamp'] = (str(current_time - duration), str(current_time))
-            result = client.results.get_latency_stat(reqid=reqid,
-                                                     method=method,
-                                                     **kwargs)
-        return result
-
-    def _get_latencies(self, trules, reqid, method, duration=None, **kwargs):
-
-        hosts = set()
-        for trule in trules:
-            src_ip = getattr(trule, 'src')
-            hosts.add(self.get_ep_host(src_ip))
-        args = [(host, (host, reqid, method, duration), kwargs)
+        self._clients.call(
+            host_ip, lambda client: client.configs.set_param(param, val))
+
+    def get_host_latency_summary(self, host_ip, reqid, duration=None,
+                                 **kwargs):
+        if duration is not None:
+            kwargs['timestamp'] = self._get_query_window(duration)
+        return self._clients.call(
+            host_ip,
+            lambda client: client.results.get_latency_summary(reqid, **kwargs))
+
+    def _get_latencies(self, trules, reqid, duration=None, **kwargs):
+        """
+        Returns latency summaries, (sum, count, min, max), from hosts
+        which have records for reqid.
+        """
+        hosts = {self.get_rule_src_host(trule) for trule in trules}
+        args = [(host, (host, reqid, duration), kwargs)
                 for host in hosts]
 
-        results = ThreadPool(self.get_host_latency, args)
-        latencies = [latency for latency in results.values()]
-        return latencies
+        results = self._fanout(self.get_host_latency_summary, args)
+        # Skip hosts with no latency data.
+        return [summary for summary in results.values()
+                if summary and summary[1]]
 
-    def get_latency(self, reqid, method, duration=None, **kwargs):
-        trules = self.get_rules_by_reqid(reqid)
-        latencies = self._get_latencies(trules, reqid, method,
-                                        duration=duration, **kwargs)
-        result = 0
-        latencies = [latency for latency in latencies if latency is not None]
-        if latencies:
-            return result
+    def _aggregate_latency(self, summaries, method):
+        if not summaries:
+            return 0
 
         if method == 'avg':
-            result = round(sum(latencies) / len(latencies), 2)
+            total = sum(summary[0] for summary in summaries)
+            count = sum(summary[1] for summary in summaries)
+            return round(total / count, 2)
         elif method == 'min':
-            result = round(min(latencies), 2)
+            return round(min(summary[2] for summary in summaries), 2)
         elif method == 'max':
-            result = round(max(latencies), 2)
-        else:
-            log.error('Invalid method: %s for get latency', method)
+            return round(max(summary[3] for summary in summaries), 2)
 
-        return result
+        log.error('Invalid method: %s for get latency', method)
+        return 0
+
+    def get_latency(self, reqid, method, duration=None, **kwargs):
+        trules = self.get_rules_by_reqid(reqid)
+        summaries = self._get_latencies(trules, reqid, duration=duration,
+                                        **kwargs)
+        return self._aggregate_latency(summaries, method)
+
+    def get_latency_bundle(self, reqid, duration=None, **kwargs):
+        """
+        Returns avg, min and max latency for reqid, fetched from hosts
+        in a single round.
+        """
+        trules = self.get_rules_by_reqid(reqid)
+        summaries = self._get_latencies(trules, reqid, duration=duration,
+                                        **kwargs)
+        return {method: self._aggregate_latency(summaries, method)
+                for method in ('avg', 'min', 'max')}
 
     def get_avg_latency(self, reqid, duration=None, **kwargs):
         return self.get_latency(reqid, method='avg', duration=duration,
@@ -578,13 +732,15 @@ class Podium(BaseApp):
 
     def _discover_interfaces(self, hostip):
         """ Helper function to discover interfaces """
-        with LydianClient(hostip) as client:
-            try:
-                client.controller.discover_interfaces()
-                self._add_endpoints(client, hostip)
-                return True
-            except Exception as _:
-                return False
+        def _discover(client):
+            client.controller.discover_interfaces()
+            self._add_endpoints(client, hostip)
+
+        try:
+            self._clients.call(hostip, _discover)
+            return True
+        except Exception as _:
+            return False
 
     def discover_interfaces(self, hostips):
         """
@@ -596,7 +752,7 @@ class Podium(BaseApp):
             List of hostips.
         """
         args = [(h, (h,), {}) for h in hostips]
-        return ThreadPool(self._discover_interfaces, args)
+        return self._fanout(self._discover_interfaces, args)
 
 
 def get_podium():
@@ -724,4 +880,7 @@ def stop_service(hosts, remove_db=True):
     args = [(host, (host, username, password, remove_db), {})
             for host in hosts]
 
+    if _podium:
+        _podium.cancel_wait()
+        _podium.close_clients(hosts)
     ThreadPool(cleanup_node, args)
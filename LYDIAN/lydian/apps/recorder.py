@@ -5,7 +5,6 @@
 # in the root directory of this project.
 
 import logging
-import queue
 import threading
 
 import lydian.common.errors as errors
@@ -13,7 +12,7 @@ import lydian.common.errors as errors
 from lydian.apps import config
 from lydian.apps.base import BaseApp, exposify
 from lydian.common.core import Subscribe
-from lydian.traffic.core import TrafficRecord
+from lydian.traffic.core import TrafficRecord, get_record_pool
 from sql30 import db
 
 
@@ -65,6 +64,32 @@ class TrafficRecordDB(db.Model):
     # SQLITE3 connection timeout.
     TIMEOUT = config.get_param('SQLITE3_CONNECTION_TIMEOUT', 20)
 
+    def latency_summary(self, tbl=None, **kwargs):
+        """
+        Returns (sum, count, min, max) of latency of the records matching
+        kwargs, computed in a single query.
+        """
+        tbl = tbl or self.TABLE
+        constraints = self._form_constraints(kwargs=kwargs)
+        query = 'SELECT SUM(latency), COUNT(latency), MIN(latency), ' \
+                'MAX(latency) FROM %s %s' % (tbl, constraints)
+        self.cursor.execute(query, kwargs)
+        total, count, _min, _max = self.cursor.fetchone()
+        return (total or 0, count, _min, _max)
+
+    def result_histogram(self, tbl=None, **kwargs):
+        """
+        Returns tuple of (result, count) pairs for the records matching
+        kwargs, computed in a single query.
+        """
+        tbl = tbl or self.TABLE
+        constraints = self._form_constraints(kwargs=kwargs)
+        query = 'SELECT result, COUNT(*) FROM %s %s GROUP BY result' % (
+            tbl, constraints)
+        self.cursor.execute(query, kwargs)
+        return tuple((result, count) for result, count in
+                     self.cursor.fetchall())
+
 
 class TrafficRecorder(TrafficRecordDB, Subscribe):
     NAME = "TRAFFIC_RECORDER"
@@ -87,14 +112,25 @@ class TrafficRecorder(TrafficRecordDB, Subscribe):
         pass
 
     def write(self, trec):
+        self.write_many([trec])
+
+    def write_many(self, trecs):
+        """ Writes a batch of records in a single database session. """
         if not self.enabled:
             return
         # TODO : Create a pool of records and flush them periodically instead.
-        if isinstance(trec, TrafficRecord):
-            with TrafficRecordDB() as db:
+        with TrafficRecordDB() as db:
+            for trec in trecs:
+                if not isinstance(trec, TrafficRecord):
+                    continue
                 values = {k: v for k, v in trec.as_dict().items() if k in self._fields}
                 values['timestamp'] = trec.timestamp
-                db.write(tbl=self.TABLE, **values)
+                try:
+                    db.write(tbl=self.TABLE, **values)
+                except Exception as err:
+                    # Skip the bad record, not the rest of the batch.
+                    log.error("Error in writing Traffic record %r : %r",
+                              trec, err)
 
 
 @exposify
@@ -107,6 +143,7 @@ class RecordManager(Subscribe, BaseApp):
     CONFIG_PARAMS = ['RECORD_UPDATER_THREAD_POOL_SIZE',
                      'RESOURCE_RECORD_REPORT_FREQ',
                      'TRAFFIC_RECORD_REPORT_FREQ']
+    BATCH_SIZE = 256    # max records handed to recorders at once.
 
     def __init__(self, traffic_records, resource_records):
         Subscribe.__init__(self)
@@ -121,6 +158,7 @@ class RecordManager(Subscribe, BaseApp):
         ]
         self._traffic_records = traffic_records
         self._resource_records = resource_records
+        self._record_pool = get_record_pool()
 
         self._stopped = threading.Event()
         self._stopped.set()  # stopped untile started.
@@ -130,6 +168,36 @@ class RecordManager(Subscribe, BaseApp):
     def stopped(self):
         return self._stopped.is_set()
 
+    def dropped_records(self):
+        """
+        Returns (traffic, resource) count of records dropped from the
+        queues since start as the recorders couldn't keep up.
+        """
+        return (getattr(self._traffic_records, 'dropped', 0),
+                getattr(self._resource_records, 'dropped', 0))
+
+    @staticmethod
+    def _any_enabled(recorders):
+        return any(r.enabled for r in recorders)
+
+    @property
+    def any_recorder_enabled(self):
+        return self._any_enabled(self._traffic_recorders)
+
+    @property
+    def any_resource_recorder_enabled(self):
+        return self._any_enabled(self._resource_recorders)
+
+    @classmethod
+    def _refresh_accepting(cls, records, recorders):
+        """
+        Lets producers of records know if they are going to be used at
+        all, i.e. if any of the recorders is enabled. Called on start and
+        on every handler wakeup, so toggling a recorder takes effect
+        within one report interval.
+        """
+        records.accepting = cls._any_enabled(recorders)
+
     def stop(self):
         self._stopped.set()
         # Stop Recorder clients
@@ -138,34 +206,58 @@ class RecordManager(Subscribe, BaseApp):
         for recorder in self._resource_recorders:
             recorder.stop()
 
+    def _write_batch(self, recorders, records):
+        """
+        Writes records to every recorder. A failing recorder doesn't keep
+        the records from the rest.
+        """
+        for recorder in recorders:
+            try:
+                recorder.write_many(records)
+            except Exception as err:
+                log.error("Error in writing records to %s : %r",
+                          type(recorder).__name__, err)
+
     def _traffic_record_handler(self):
         while not self._stopped.is_set():
             try:
-                # TODO : Add logic for flush interval / buffer.
-                t_record = self._traffic_records.get(
+                self._refresh_accepting(self._traffic_records,
+                                        self._traffic_recorders)
+                t_records = self._traffic_records.get_batch(
+                    self.BATCH_SIZE,
                     timeout=self.get_config('TRAFFIC_RECORD_REPORT_FREQ'))
-                for recorder in self._traffic_recorders:
-                    recorder.write(t_record)
-            except queue.Empty:
-                pass
+                if not t_records:
+                    continue
+                try:
+                    self._write_batch(self._traffic_recorders, t_records)
+                finally:
+                    # Records are not referred anymore. Return them
+                    # to pool for reuse.
+                    for t_record in t_records:
+                        self._record_pool.release(t_record)
             except Exception as err:
                 log.error("Error in handling Traffic records : %r", err)
 
     def _resource_record_handler(self):
         while not self._stopped.is_set():
             try:
-                # TODO : Add logic for flush interval / buffer.
-                t_record = self._resource_records.get(
+                self._refresh_accepting(self._resource_records,
+                                        self._resource_recorders)
+                r_records = self._resource_records.get_batch(
+                    self.BATCH_SIZE,
                     timeout=self.get_config('RESOURCE_RECORD_REPORT_FREQ'))
-                for recorder in self._resource_recorders:
-                    recorder.write(t_record)
-            except queue.Empty:
-                pass
+                if not r_records:
+                    continue
+                self._write_batch(self._resource_recorders, r_records)
             except Exception as err:
                 log.error("Error in handling Resource records %r", err)
 
     def start(self, blocking=False):
         self._stopped.clear()
+        self._refresh_accepting(self._traffic_records,
+                                self._traffic_recorders)
+        self._refresh_accepting(self._resource_records,
+                                self._resource_recorders)
 
         # Traffic Records Handler
         thandler = threading.Thread(target=self._traffic_record_handler,
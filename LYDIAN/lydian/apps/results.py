@@ -8,7 +8,8 @@ Generic Results app. Gives results for traffic operations.
 '''
 
 import logging
-import pickle
+
+import msgpack
 
 from lydian.apps.base import BaseApp, exposify
 from lydian.apps.recorder import TrafficRecordDB
@@ -20,19 +21,42 @@ log = logging.getLogger(__name__)
 @exposify
 class Results(BaseApp):
 
-    def traffic(self, reqid, **kwargs):
+    def __init__(self, recorder=None):
+        # RecordManager of this node, if any, for stats on recording.
+        self._recorder = recorder
+
+    def _get_filter(self, kwargs):
         _filter = {}
         for key, value in kwargs.items():
             if key in TrafficRecordDB.SCHEMA:
                 _filter[key] = value
             else:
                 log.info("Skipping invalid TrafficRecord key:%s", key)
+        return _filter
+
+    def traffic(self, reqid, **kwargs):
+        """
+        Returns traffic records for reqid as msgpack encoded map of
+        'fields' (column names, sent once) and 'rows' (tuple of values
+        per record).
+        """
+        _filter = self._get_filter(kwargs)
 
-        result = []
         with TrafficRecordDB() as db:
-            result = db.read(tbl=db.TABLE, reqid=reqid, **_filter)
+            result = db.read(tbl=db.TABLE, include_header=True, reqid=reqid,
+                             **_filter)
+
+        return msgpack.packb({'fields': result[0], 'rows': result[1:]},
+                             use_bin_type=True)
 
-        return pickle.dumps(result)
+    def result_histogram(self, reqid, **kwargs):
+        """
+        Returns number of traffic records for reqid per result, as tuple
+        of (result, count) pairs.
+        """
+        _filter = self._get_filter(kwargs)
+        with TrafficRecordDB() as db:
+            return db.result_histogram(tbl=db.TABLE, reqid=reqid, **_filter)
 
     def traffic_records_count(self, **kwargs):
         """
@@ -44,12 +68,7 @@ class Results(BaseApp):
         return count
 
     def get_latency_stat(self, reqid, method, **kwargs):
-        _filter = {}
-        for key, value in kwargs.items():
-            if key in TrafficRecordDB.SCHEMA:
-                _filter[key] = value
-            else:
-                log.info("Skipping invalid TrafficRecord key:%s", key)
+        _filter = self._get_filter(kwargs)
 
         result = None
         with TrafficRecordDB() as db:
@@ -64,6 +83,15 @@ class Results(BaseApp):
 
         return result
 
+    def get_latency_summary(self, reqid, **kwargs):
+        """
+        Returns (sum, count, min, max) of latency for reqid. Lets callers
+        aggregate latency across hosts correctly in one call.
+        """
+        _filter = self._get_filter(kwargs)
+        with TrafficRecordDB() as db:
+            return db.latency_summary(tbl=db.TABLE, reqid=reqid, **_filter)
+
     def get_avg_latency(self, reqid, **kwargs):
         return self.get_latency_stat(reqid, method='avg', **kwargs)
 
@@ -73,6 +101,15 @@ class Results(BaseApp):
     def get_max_latency(self, reqid, **kwargs):
         return self.get_latency_stat(reqid, method='max', **kwargs)
 
+    def dropped_records(self):
+        """
+        Returns (traffic, resource) count of records dropped as the
+        recorders couldn't keep up.
+        """
+        if not self._recorder:
+            return (0, 0)
+        return self._recorder.dropped_records()
+
     def delete_record(self, reqid, **kwargs):
         with TrafficRecordDB() as db:
             db.delete(tbl=db.TABLE, reqid=reqid, **kwargs)
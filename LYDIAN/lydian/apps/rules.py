@@ -12,6 +12,7 @@ in the system at a given point of time. Rules at endpoints would only
 be related to that endpoint host.
 '''
 
+import collections
 import logging
 import os
 
@@ -57,6 +58,8 @@ class RulesApp(RulesDB, BaseApp):
 
         super(RulesApp, self).__init__(db_name=db_name)
         self._rules = {}    # represents local cache.
+        # reqid -> {ruleid: rule} index over local cache.
+        self._reqid_rules = collections.defaultdict(dict)
         self.table = self.TABLE
         self.load_from_db()
 
@@ -67,6 +70,34 @@ class RulesApp(RulesDB, BaseApp):
     def get(self, ruleid):
         return self._rules.get(ruleid)
 
+    def get_rules_by_reqid(self, reqid):
+        """ Returns rules for reqid. """
+        return list(self._reqid_rules.get(reqid, {}).values())
+
+    def _cache(self, trule):
+        # Rule is replaced in place, so as readers never miss it.
+        ruleid = getattr(trule, 'ruleid', None)
+        reqid = getattr(trule, 'reqid', None)
+        old = self._rules.get(ruleid)
+        self._rules[ruleid] = trule
+        self._reqid_rules[reqid][ruleid] = trule
+        if old is not None:
+            old_reqid = getattr(old, 'reqid', None)
+            if old_reqid != reqid:
+                self._unindex(old_reqid, ruleid)
+
+    def _unindex(self, reqid, ruleid):
+        reqid_rules = self._reqid_rules.get(reqid, {})
+        reqid_rules.pop(ruleid, None)
+        if not reqid_rules:
+            self._reqid_rules.pop(reqid, None)
+
+    def _uncache(self, ruleid):
+        trule = self._rules.pop(ruleid, None)
+        if trule is None:
+            return
+        self._unindex(getattr(trule, 'reqid', None), ruleid)
+
     def add(self, trule, save_to_db=True):
         """
         Adds a rule in local cache and database and returns
@@ -74,7 +105,7 @@ class RulesApp(RulesDB, BaseApp):
         """
         if save_to_db:
             self.save_to_db([trule])
-        self._rules[trule.ruleid] = trule
+        self._cache(trule)
 
     def add_rules(self, trules):
         """ Adds multiple rules. """
@@ -88,8 +119,15 @@ class RulesApp(RulesDB, BaseApp):
             db.table = self.table
             for ruleid in ruleids:
                 db.delete(ruleid=ruleid)
-                if ruleid in self._rules:
-                    self._rules.pop(ruleid)
+                self._uncache(ruleid)
+
+    def delete_rules_by_reqid(self, reqid):
+        """ Delete all the rules for reqid. """
+        with RulesDB() as db:
+            db.table = self.table
+            db.delete(reqid=reqid)
+        for trule in self.get_rules_by_reqid(reqid):
+            self._uncache(trule.ruleid)
 
     def load_from_db(self):
         """ Loads rules from DB to local file."""
@@ -115,7 +153,7 @@ class RulesApp(RulesDB, BaseApp):
             if not ruleid:
                 log.error("Skipped Invalid rule with no ruleid : %s",
                            trule.__dict__)
-            self._rules[ruleid] = trule
+            self._cache(trule)
 
     def save_to_db(self, trules):
         """
@@ -78,8 +78,9 @@ class TrafficControllerApp(BaseApp):
         self._ep_map['127.0.0.1'] = host_target
         self._ep_map['::1'] = host_target
 
+        ns_prefixes = tuple(NAMESPACE_INTERFACE_NAME_PREFIXES)
         for ifname in self._if_mgr.get_all_interfaces():
-            if not any([ifname.startswith(x) for x in NAMESPACE_INTERFACE_NAME_PREFIXES]):
+            if not ifname.startswith(ns_prefixes):
                 continue
             ips = self._if_mgr.get_ips_by_interface(ifname)
             for ip in ips:
@@ -0,0 +1,133 @@
+#!/usr/bin/env python
+# Copyright (c) 2020-2021 VMware, Inc. All Rights Reserved.
+# SPDX-License-Identifier: BSD-2 License
+# The full license information can be found in LICENSE.txt
+# in the root directory of this project.
+
+"""
+Implements a fixed size circular FIFO queue for passing records from
+producers (traffic / resource apps) to the record manager.
+"""
+import queue
+import threading
+import time
+
+
+class CircularFifoQueue(object):
+    # Policies for put() on a full queue.
+    REJECT = 'reject'           # raise queue.Full
+    OVERWRITE = 'overwrite'     # drop the oldest item to make room
+
+    def __init__(self, maxsize, mode=REJECT):
+        """
+        A bounded FIFO queue backed by a preallocated list. Slots are
+        reused so that no memory is allocated per record.
+
+        Drop in replacement for queue.Queue as far as records queues are
+        concerned, except that put() never blocks. When full, it raises
+        queue.Full right away in REJECT mode. In OVERWRITE mode, the
+        oldest item is dropped instead and counted in 'dropped'.
+
+        'accepting' is a hint for producers, set by the consumer. When
+        False, nobody would use the records, so producers can skip
+        creating and enqueuing them.
+        """
+        assert maxsize > 0, "Queue size must be positive."
+        assert mode in (self.REJECT, self.OVERWRITE), \
+            "Invalid mode %r." % mode
+        self._maxsize = maxsize
+        self._mode = mode
+        self._buf = [None] * maxsize
+        self._head = 0      # index of oldest item.
+        self._tail = 0      # index of next free slot.
+        self._size = 0
+        self._lock = threading.Lock()
+        self._nonempty = threading.Event()
+        self.accepting = True
+        self.dropped = 0    # items overwritten in OVERWRITE mode.
+
+    @property
+    def maxsize(self):
+        return self._maxsize
+
+    @property
+    def mode(self):
+        return self._mode
+
+    def qsize(self):
+        return self._size
+
+    def empty(self):
+        return not self._size
+
+    def full(self):
+        return self._size == self._maxsize
+
+    def put(self, item, block=True, timeout=None):
+        """
+        Puts item at the end of queue. 'block' and 'timeout' are accepted
+        for compatibility with queue.Queue and are ignored.
+        """
+        with self._lock:
+            if self._size == self._maxsize:
+                if self._mode != self.OVERWRITE:
+                    raise queue.Full
+                # Tail is at head when full. Overwrite the oldest item.
+                self._buf[self._tail] = item
+                self._tail = self._head = (self._head + 1) % self._maxsize
+                self.dropped += 1
+                return
+            self._buf[self._tail] = item
+            self._tail = (self._tail + 1) % self._maxsize
+            self._size += 1
+            self._nonempty.set()
+
+    def put_nowait(self, item):
+        return self.put(item, block=False)
+
+    def _pop(self):
+        item = self._buf[self._head]
+        self._buf[self._head] = None    # don't hold on to consumed item.
+        self._head = (self._head + 1) % self._maxsize
+        self._size -= 1
+        if not self._size:
+            self._nonempty.clear()
+        return item
+
+    def get(self, block=True, timeout=None):
+        """
+        Removes and returns the oldest item from the queue. Raises
+        queue.Empty if no item is available (within timeout seconds,
+        if blocking).
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while True:
+            with self._lock:
+                if self._size:
+                    return self._pop()
+
+            if not block:
+                raise queue.Empty
+
+            remaining = None
+            if deadline is not None:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    raise queue.Empty
+            self._nonempty.wait(remaining)
+
+    def get_nowait(self):
+        return self.get(block=False)
+
+    def get_batch(self, max_items, timeout=None):
+        """
+        Removes and returns up to max_items oldest items as a list. Waits
+        up to timeout seconds for an item to be available. Returns an
+        empty list if none became available.
+        """
+        if not self._nonempty.wait(timeout):
+            return []
+
+        with self._lock:
+            count = min(max_items, self._size)
+            return [self._pop() for _ in range(count)]
@@ -3,15 +3,18 @@
 # SPDX-License-Identifier: BSD-2 License
 # The full license information can be found in LICENSE.txt
 # in the root directory of this project.
+import contextlib
 import errno
 import logging
 import pickle
 import socket
+import threading
 import time
 
 import rpyc
 
 from lydian.apps import config
+from lydian.common.background import BackgroundMixin
 
 rpyc.core.protocol.DEFAULT_CONFIG['allow_pickle'] = True
 log = logging.getLogger(__name__)
@@ -214,12 +217,18 @@ class ResultsManager(Manager):
     def traffic(self, reqid, **kwargs):
         return self._client.results.traffic(reqid, **kwargs)
 
+    def result_histogram(self, reqid, **kwargs):
+        return self._client.results.result_histogram(reqid, **kwargs)
+
     def traffic_records_count(self, **kwargs):
         return self._client.results.traffic_records_count(**kwargs)
 
     def get_latency_stat(self, reqid, method, **kwargs):
         return self._client.results.get_latency_stat(reqid=reqid, method=method, **kwargs)
 
+    def get_latency_summary(self, reqid, **kwargs):
+        return self._client.results.get_latency_summary(reqid, **kwargs)
+
     def get_avg_latency(self, reqid, **kwargs):
         return self._client.results.get_avg_latency(reqid, **kwargs)
 
@@ -232,6 +241,9 @@ class ResultsManager(Manager):
     def delete_record(self, reqid, **kwargs):
         return self._client.results.delete_record(reqid, **kwargs)
 
+    def dropped_records(self):
+        return self._client.results.dropped_records()
+
 
 class TrafficControllerManager(Manager):
 
@@ -480,3 +492,186 @@ class LydianClient(object):
 
     def __exit__(self, exc_type, exc_val, exc_tb):
         self.close()
+
+
+class _PooledClient(object):
+
+    def __init__(self, client):
+        self.client = client
+        self.users = 0          # number of ongoing operations.
+        self.last_used = time.time()
+        self.broken = False
+
+
+class LydianClientPool(BackgroundMixin):
+    """
+    Cache of connected LydianClient(s), up to MAX_HOST_CONNECTIONS per
+    host. Saves connection setup for every RPC to a host. Endpoint serves
+    requests on a connection one at a time, so an idle connection is
+    preferred (or a new one made) over sharing a busy one. Connections
+    left unused for IDLE_TIMEOUT seconds are closed by a background
+    reaper, started upon first use.
+    """
+    IDLE_TIMEOUT = 300      # seconds
+    REAP_INTERVAL = 30      # seconds
+    MAX_HOST_CONNECTIONS = 4
+
+    def __init__(self, idle_timeout=None, max_host_connections=None):
+        super(LydianClientPool, self).__init__()
+        self._task_name = 'LydianClientPool Reaper'
+        self._run = self._reap
+        self._idle_timeout = idle_timeout or self.IDLE_TIMEOUT
+        self._max_host_connections = (max_host_connections or
+                                      self.MAX_HOST_CONNECTIONS)
+        self._clients = {}      # host -> list of _PooledClient
+        self._lock = threading.Lock()
+
+    def _pick(self, host):
+        """
+        Returns an idle (else the least busy, if no more connections can
+        be made) connected entry for host, or None. Called with lock held.
+        """
+        entries = self._clients.get(host, [])
+        entries[:] = [e for e in entries if e.client.connected]
+        if not entries:
+            return None
+        entry = min(entries, key=lambda e: e.users)
+        if entry.users and len(entries) < self._max_host_connections:
+            return None
+        return entry
+
+    def _acquire(self, host, reuse=True):
+        """
+        Returns (entry, reused) for host. A new connection is made if
+        reuse is False.
+        """
+        with self._lock:
+            if self.stopped:
+                self.on()   # Reaper, stopped in close(), if pool reused.
+            entry = self._pick(host) if reuse else None
+            if entry:
+                entry.users += 1
+                return entry, True
+
+        # Connect outside the lock so as other hosts are not held up.
+        client = LydianClient(host)
+        client.connect()
+
+        entry = _PooledClient(client)
+        entry.users += 1
+        with self._lock:
+            self._clients.setdefault(host, []).append(entry)
+        return entry, False
+
+    def _release(self, host, entry, broken=False):
+        with self._lock:
+            entry.users -= 1
+            entry.last_used = time.time()
+            if broken or not entry.client.connected:
+                entry.broken = True
+                entries = self._clients.get(host, [])
+                if entry in entries:
+                    entries.remove(entry)
+                if not entries:
+                    self._clients.pop(host, None)
+            close = entry.broken and not entry.users
+
+        if close:
+            entry.client.close()
+
+    @contextlib.contextmanager
+    def get(self, host):
+        """
+        Context manager yielding a connected client for host. Connection
+        is retained for reuse after the block, unless it broke.
+        """
+        entry, _ = self._acquire(host)
+        broken = False
+        try:
+            yield entry.client
+        except (EOFError, OSError):
+            broken = True
+            raise
+        finally:
+            self._release(host, entry, broken)
+
+    def call(self, host, func, *args, **kwargs):
+        """
+        Returns func(client, *args, **kwargs) run with a connected client
+        for host. If a cached connection turns out broken (e.g. endpoint
+        service restarted since), func is retried once on a new one.
+        """
+        entry, reused = self._acquire(host)
+        try:
+            result = func(entry.client, *args, **kwargs)
+        except (EOFError, OSError) as err:
+            self._release(host, entry, broken=True)
+            if not reused:
+                raise
+            log.info("Retrying on new connection to %s : %r", host, err)
+        except Exception:
+            self._release(host, entry)
+            raise
+        else:
+            self._release(host, entry)
+            return result
+
+        entry, _ = self._acquire(host, reuse=False)
+        broken = False
+        try:
+            return func(entry.client, *args, **kwargs)
+        except (EOFError, OSError):
+            broken = True
+            raise
+        finally:
+            self._release(host, entry, broken)
+
+    def close_idle(self):
+        """ Closes connections not used for idle timeout seconds. """
+        idle = []
+        now = time.time()
+        with self._lock:
+            for host, entries in list(self._clients.items()):
+                for entry in list(entries):
+                    if entry.users:
+                        continue
+                    if now - entry.last_used > self._idle_timeout:
+                        entries.remove(entry)
+                        idle.append(entry)
+                if not entries:
+                    self._clients.pop(host)
+
+        for entry in idle:
+            entry.client.close()
+
+    def _reap(self):
+        while not self._stop_switch.wait(self.REAP_INTERVAL):
+            try:
+                self.close_idle()
+            except Exception as err:
+                log.error("Error in closing idle connections : %r", err)
+
+    def discard(self, hosts=None):
+        """ Closes connections to hosts (all the hosts, if None). """
+        idle = []
+        with self._lock:
+            if hosts is None:
+                hosts = list(self._clients.keys())
+            for host in hosts:
+                for entry in self._clients.pop(host, []):
+                    # In use ones are closed upon release.
+                    entry.broken = True
+                    if not entry.users:
+                        idle.append(entry)
+
+        for entry in idle:
+            entry.client.close()
+
+    def close(self):
+        """
+        Stops reaper and closes all the connections. Pool remains usable;
+        reaper is started again upon next use.
+        """
+        if not self.stopped:
+            self.off()
+        self.discard()
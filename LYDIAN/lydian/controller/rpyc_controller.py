@@ -7,7 +7,6 @@
 
 import logging
 import os
-from queue import Queue
 
 import rpyc
 from rpyc.utils.server import ThreadPoolServer
@@ -27,6 +26,7 @@ from lydian.apps.tcpdump import TCPDump
 from lydian.apps.pentest.rapidscan import Rapidscan
 from lydian.apps.traffic_controller import TrafficControllerApp
 from lydian.apps.watch.threat import ThreatMonitor
+from lydian.common.fifo import CircularFifoQueue
 from lydian.utils import logger, common
 
 
@@ -69,8 +69,12 @@ class LydianService(LydianServiceBase):
     def __init__(self):
         super(LydianService, self).__init__()
 
-        self._traffic_records = Queue(self.RECORD_QUEUE_SIZE)
-        self._resource_records = Queue(self.RECORD_QUEUE_SIZE)
+        # Producers must never block / fail on records. If the recorders
+        # fall behind, oldest records are dropped (and counted).
+        self._traffic_records = CircularFifoQueue(
+            self.RECORD_QUEUE_SIZE, mode=CircularFifoQueue.OVERWRITE)
+        self._resource_records = CircularFifoQueue(
+            self.RECORD_QUEUE_SIZE, mode=CircularFifoQueue.OVERWRITE)
 
         self.recorder = RecordManager(self._traffic_records,
                                       self._resource_records)
@@ -93,7 +97,7 @@ class LydianService(LydianServiceBase):
         self.monitor = ResourceMonitor(self._resource_records)
         self.tcpdump = TCPDump()
         self.iperf = Iperf()
-        self.results = Results()
+        self.results = Results(recorder=self.recorder)
         self.configs = config.get_configs()
 
         self.lynis = Lynis()
@@ -53,6 +53,18 @@ class ElasticSearchRecorder(core.Subscribe):
     def enabled(self):
         return self.get_config(self.ENABLE_PARAM)
 
+    def write(self, record):
+        if not self.enabled:
+            return
+        self._write(record)
+
+    def write_many(self, records):
+        """ Writes a batch of records. """
+        if not self.enabled:
+            return
+        for record in records:
+            self._write(record)
+
     def stop(self):
         if self._client:
             self._client.transport.close()
@@ -69,9 +81,7 @@ class ElasticSearchTrafficRecorder(ElasticSearchRecorder):
         except Exception as e:
             log.error("Failed to send data to elasticsearch due to %s" % e)
 
-    def write(self, traffic_record):
-        if not self.enabled:
-            return
+    def _write(self, traffic_record):
         body = {"datacenter": self._testbed,
                 "test_id": self._testid, "type": "record",
                 'timestamp': time.time()}
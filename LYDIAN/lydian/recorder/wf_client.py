@@ -60,6 +60,9 @@ def _get_wf_sender():
 
 
 class WavefrontRecorder(core.Subscribe):
+    # Params read while writing records. Cached locally (and refreshed
+    # upon update) to keep config lookups out of the per record path.
+    CONFIG_PARAMS = ['WAVEFRONT_SOURCE_TAG', 'WAVEFRONT_USE_UNIQUE_METRIC']
     ENABLE_PARAM = 'WAVEFRONT_RECORDING'
 
     def __init__(self):
@@ -67,6 +70,7 @@ class WavefrontRecorder(core.Subscribe):
         self._client = _get_wf_sender()
         self._testbed = conf.get_param('TESTBED_NAME')
         self._testid = str(conf.get_param('TEST_ID'))
+        self._source = self._get_source()
         self.node = socket.gethostname()
 
         if not self._client:
@@ -78,6 +82,25 @@ class WavefrontRecorder(core.Subscribe):
     def enabled(self):
         return self.get_config(self.ENABLE_PARAM)
 
+    def _get_source(self):
+        return self.get_config('WAVEFRONT_SOURCE_TAG') or self._testbed
+
+    def update_config(self, param):
+        super(WavefrontRecorder, self).update_config(param)
+        self._source = self._get_source()
+
+    def write(self, record):
+        if not self.enabled:
+            return
+        self._write(record)
+
+    def write_many(self, records):
+        """ Writes a batch of records. """
+        if not self.enabled:
+            return
+        for record in records:
+            self._write(record)
+
     def stop(self):
         if self._client:
             if isinstance(self._client, WavefrontDirectClient):
@@ -86,79 +109,122 @@ class WavefrontRecorder(core.Subscribe):
 
 
 class WavefrontTrafficRecorder(WavefrontRecorder):
-    CONFIG_PARAMS = ['WAVEFRONT_TRAFFIC_RECORDING']
+    CONFIG_PARAMS = WavefrontRecorder.CONFIG_PARAMS + [
+        'WAVEFRONT_TRAFFIC_RECORDING']
     ENABLE_PARAM = 'WAVEFRONT_TRAFFIC_RECORDING'
 
+    def __init__(self):
+        super(WavefrontTrafficRecorder, self).__init__()
+        # Tags which remain same across all the records.
+        self._base_tags = {
+            "datacenter": self._testbed,
+            "test_id": self._testid,
+            "node": self.node
+            }
+        # protocol -> (result metric name, latency metric name)
+        self._metric_names = {}
+
     @property
     def prefix(self):
-        if conf.get_param('WAVEFRONT_USE_UNIQUE_METRIC'):
+        if self.get_config('WAVEFRONT_USE_UNIQUE_METRIC'):
             return 'lydian.traffic.%s.%s.' % (self._testbed, self._testid)
         else:
             return 'lydian.traffic.'
 
-    def write(self, record):
-        if not self.enabled:
-            return
+    def update_config(self, param):
+        super(WavefrontTrafficRecorder, self).update_config(param)
+        self._metric_names = {}     # prefix may have changed.
+
+    def _get_metric_names(self, protocol):
+        names = self._metric_names.get(protocol)
+        if names is None:
+            prefix = self.prefix + protocol
+            names = (prefix + ".result", prefix + ".latency")
+            self._metric_names[protocol] = names
+        return names
+
+    def _write(self, record):
         # assert isinstance(trec, TrafficRecord)
-        prefix =  self.prefix + record.protocol
-        tags = {
-            "datacenter": self._testbed,
-            "test_id": self._testid,
-            "reqid": record.reqid,
-            "ruleid": record.ruleid,
-            "origin": record.source,
-            "destination": record.destination,
-            "node": self.node
-            }
+        result_name, latency_name = self._get_metric_names(record.protocol)
+        tags = dict(self._base_tags,
+                    reqid=record.reqid,
+                    ruleid=record.ruleid,
+                    origin=record.source,
+                    destination=record.destination)
 
-        source = conf.get_param('WAVEFRONT_SOURCE_TAG') or self._testbed
+        source = self._source
 
         # Record Traffic Data
         value = 1 if record.result else 0
-        name = prefix + ".result"
         self._client.send_metric(
-                    name=name, value=value,
+                    name=result_name, value=value,
                     timestamp=record.timestamp,
                     source=source,
                     tags=tags)
 
         # Record Latency data
-        name = prefix + ".latency"
         self._client.send_metric(
-                    name=name, value=record.latency,
+                    name=latency_name, value=record.latency,
                     timestamp=record.timestamp,
                     source=source,
                     tags=tags)
 
 
 class WavefrontResourceRecorder(WavefrontRecorder):
-    CONFIG_PARAMS = ['WAVEFRONT_RESOURCE_RECORDING']
+    CONFIG_PARAMS = WavefrontRecorder.CONFIG_PARAMS + [
+        'WAVEFRONT_RESOURCE_RECORDING']
     ENABLE_PARAM = 'WAVEFRONT_RESOURCE_RECORDING'
+    SKIP_KEYS = frozenset(['_id', '_timestamp'])
+
+    def __init__(self):
+        super(WavefrontResourceRecorder, self).__init__()
+        # Tags are same for all the resource records of this node.
+        self._tags = {
+            "datacenter": self._testbed,
+            "node": self.node,
+            "test_id": self._testid
+            }
+        # resource key -> metric name
+        self._metric_names = {}
 
     @property
     def prefix(self):
-        if conf.get_param('WAVEFRONT_USE_UNIQUE_METRIC'):
+        if self.get_config('WAVEFRONT_USE_UNIQUE_METRIC'):
             return 'lydian.resources.%s.%s.' % (self._testbed, self._testid)
         else:
             return 'lydian.resources.'
 
-    def write(self, record):
+    def update_config(self, param):
+        super(WavefrontResourceRecorder, self).update_config(param)
+        self._metric_names = {}     # prefix may have changed.
+
+    def _send(self, records):
+        # assert isinstance(record, ResourceRecord)
+        send = self._client.send_metric
+        source = self._source
+        tags = self._tags
+        names = self._metric_names
+        skip = self.SKIP_KEYS
+        prefix = None
+
+        for record in records:
+            ts = record.timestamp
+            for key, val in record.as_dict().items():
+                if key in skip:
+                    continue
+                metric = names.get(key)
+                if metric is None:
+                    if prefix is None:
+                        prefix = self.prefix
+                    metric = names[key] = prefix + key
+                send(name=metric, value=val, timestamp=ts,
+                     source=source, tags=tags)
+
+    def _write(self, record):
+        self._send((record,))
+
+    def write_many(self, records):
+        """ Writes a batch of records, sharing lookups across them. """
         if not self.enabled:
             return
-        # assert isinstance(trec, ResourceRecord)
-        prefix = self.prefix
-        source = conf.get_param('WAVEFRONT_SOURCE_TAG') or self._testbed
-        tags = {
-            "datacenter": self._testbed,
-            "node": self.node,
-            "test_id": self._testid
-            }
-        for key, val in record.as_dict().items():
-            if key in ['_id', '_timestamp']:
-                continue
-            metric = prefix + key
-            self._client.send_metric(
-                    name=metric, value=val,
-                    timestamp=record.timestamp,
-                    source=source,
-                    tags=tags)
+        self._send(records)
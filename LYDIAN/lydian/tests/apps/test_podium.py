@@ -0,0 +1,37 @@
+#!/usr/bin/env python
+# Copyright (c) 2020-2021 VMware, Inc. All Rights Reserved.
+# SPDX-License-Identifier: BSD-2 License
+# The full license information can be found in LICENSE.txt
+# in the root directory of this project.
+
+import unittest
+
+from lydian.apps.podium import Podium
+
+
+class AggregateLatencyTest(unittest.TestCase):
+
+    # (sum, count, min, max) of latency per host.
+    SUMMARIES = [
+        (10.0, 4, 1.0, 4.0),
+        (30.0, 1, 30.0, 30.0),
+        (5.0, 5, 0.5, 1.5)
+    ]
+
+    def setUp(self):
+        # Aggregation needs no state. Skip Podium setup.
+        self.podium = Podium.__new__(Podium)
+
+    def test_aggregate(self):
+        aggregate = self.podium._aggregate_latency
+        # TEST : Average is weighted by record count of every host.
+        self.assertEqual(aggregate(self.SUMMARIES, 'avg'), 4.5)
+        self.assertEqual(aggregate(self.SUMMARIES, 'min'), 0.5)
+        self.assertEqual(aggregate(self.SUMMARIES, 'max'), 30.0)
+        self.assertEqual(aggregate(self.SUMMARIES[1:2], 'avg'), 30.0)
+
+    def test_aggregate_no_data(self):
+        aggregate = self.podium._aggregate_latency
+        for method in ('avg', 'min', 'max'):
+            self.assertEqual(aggregate([], method), 0)
+        self.assertEqual(aggregate(self.SUMMARIES, 'median'), 0)
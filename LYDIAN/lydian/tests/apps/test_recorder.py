@@ -0,0 +1,54 @@
+#!/usr/bin/env python
+# Copyright (c) 2020-2021 VMware, Inc. All Rights Reserved.
+# SPDX-License-Identifier: BSD-2 License
+# The full license information can be found in LICENSE.txt
+# in the root directory of this project.
+
+import os
+import unittest
+
+from lydian.apps.recorder import TrafficRecordDB
+
+
+DB_NAME = './traffic_test.db'
+
+
+class TrafficRecordDBTest(unittest.TestCase):
+
+    RECORDS = [
+        # (reqid, result, latency)
+        ('req1', True, 0.0),
+        ('req1', True, 1.0),
+        ('req1', False, 3.0),
+        ('req1', True, 5.0),
+        ('req1', False, 6.0),
+        ('req2', True, 100.0),
+    ]
+
+    def setUp(self):
+        if os.path.exists(DB_NAME):
+            os.remove(DB_NAME)
+        with TrafficRecordDB(db_name=DB_NAME) as db:
+            for reqid, result, latency in self.RECORDS:
+                db.write(tbl=db.TABLE, reqid=reqid, result=result,
+                         latency=latency)
+
+    def test_latency_summary(self):
+        with TrafficRecordDB(db_name=DB_NAME) as db:
+            self.assertEqual(db.latency_summary(reqid='req1'),
+                             (15.0, 5, 0.0, 6.0))
+            self.assertEqual(db.latency_summary(reqid='req1', result='0'),
+                             (9.0, 2, 3.0, 6.0))
+            # TEST : No matching records.
+            self.assertEqual(db.latency_summary(reqid='req3'),
+                             (0, 0, None, None))
+
+    def test_result_histogram(self):
+        with TrafficRecordDB(db_name=DB_NAME) as db:
+            self.assertEqual(db.result_histogram(reqid='req1'),
+                             (('0', 2), ('1', 3)))
+            self.assertEqual(db.result_histogram(reqid='req2'), (('1', 1),))
+            self.assertEqual(db.result_histogram(reqid='req3'), ())
+
+    def tearDown(self):
+        os.remove(DB_NAME)
@@ -90,5 +90,41 @@ class RulesAppTest(unittest.TestCase):
         assert not self.rulesApp.is_enabled(trules[0].ruleid)
         assert self.rulesApp.is_enabled(trules[1].ruleid)
 
+    def test_rules_by_reqid(self):
+        self.rulesApp = self._get_new_app()
+        reqid = '%s' % uuid.uuid4()
+
+        trules = []
+        for x in range(10):
+            rule = {k: v for k, v in self.DUMMY_RULE.items()}
+            rule['ruleid'] = '%s' % uuid.uuid4()
+            rule['reqid'] = reqid
+            trules.append(self._get_trule(rule))
+        self.rulesApp.add_rules(trules)
+
+        # TEST : Rules are looked up by reqid, before and after reload.
+        self.assertEqual(len(self.rulesApp.get_rules_by_reqid(reqid)), 10)
+        self.rulesApp = self._get_new_app()
+        self.assertEqual(len(self.rulesApp.get_rules_by_reqid(reqid)), 10)
+
+        # TEST : Deleted rules are no more returned.
+        self.rulesApp.delete_rules([trules[0].ruleid])
+        self.assertEqual(len(self.rulesApp.get_rules_by_reqid(reqid)), 9)
+        self.rulesApp.delete_rules_by_reqid(reqid)
+        assert not self.rulesApp.get_rules_by_reqid(reqid)
+        assert not self.rulesApp.get(trules[1].ruleid)
+
+        # TEST : Re-added rule is indexed only under its new reqid.
+        new_reqid = '%s' % uuid.uuid4()
+        rule = {k: v for k, v in self.DUMMY_RULE.items()}
+        rule['ruleid'] = trules[1].ruleid
+        rule['reqid'] = reqid
+        self.rulesApp.add(self._get_trule(rule))
+        rule['reqid'] = new_reqid
+        self.rulesApp.add(self._get_trule(rule))
+        assert not self.rulesApp.get_rules_by_reqid(reqid)
+        self.assertEqual(len(self.rulesApp.get_rules_by_reqid(new_reqid)), 1)
+        self.assertEqual(self.rulesApp.get(rule['ruleid']).reqid, new_reqid)
+
     def tearDown(self):
         os.remove(DB_NAME)
@@ -0,0 +1,72 @@
+#!/usr/bin/env python
+# Copyright (c) 2020-2021 VMware, Inc. All Rights Reserved.
+# SPDX-License-Identifier: BSD-2 License
+# The full license information can be found in LICENSE.txt
+# in the root directory of this project.
+
+import queue
+import threading
+import time
+import unittest
+
+from lydian.common.fifo import CircularFifoQueue
+
+
+class CircularFifoQueueTest(unittest.TestCase):
+
+    def setUp(self):
+        self.fifo = CircularFifoQueue(5)
+
+    def test_fifo_order(self):
+        # Go around the ring a few times.
+        for x in range(12):
+            self.fifo.put(x)
+            self.assertEqual(self.fifo.get(), x)
+
+        for x in range(5):
+            self.fifo.put_nowait(x)
+        self.assertEqual([self.fifo.get_nowait() for _ in range(5)],
+                         list(range(5)))
+
+    def test_full_and_empty(self):
+        self.assertTrue(self.fifo.empty())
+        self.assertRaises(queue.Empty, self.fifo.get_nowait)
+        self.assertRaises(queue.Empty, self.fifo.get, timeout=0.1)
+
+        for x in range(5):
+            self.fifo.put(x)
+        self.assertTrue(self.fifo.full())
+        self.assertEqual(self.fifo.qsize(), 5)
+        self.assertRaises(queue.Full, self.fifo.put, 5, block=False,
+                          timeout=2)
+
+    def test_blocking_get(self):
+        timer = threading.Timer(0.2, self.fifo.put, args=(100,))
+        timer.start()
+        st = time.time()
+        self.assertEqual(self.fifo.get(timeout=5), 100)
+        self.assertLess(time.time() - st, 5)
+        timer.join()
+
+    def test_overwrite(self):
+        fifo = CircularFifoQueue(3, mode=CircularFifoQueue.OVERWRITE)
+        for x in range(7):
+            fifo.put(x)
+        self.assertTrue(fifo.full())
+        self.assertEqual(fifo.dropped, 4)
+        self.assertEqual(fifo.get_batch(5), [4, 5, 6])
+
+        # Order is kept once there is room again.
+        fifo.put(7)
+        fifo.put(8)
+        self.assertEqual([fifo.get(), fifo.get()], [7, 8])
+        self.assertEqual(fifo.dropped, 4)
+
+    def test_get_batch(self):
+        self.assertEqual(self.fifo.get_batch(3, timeout=0.1), [])
+
+        for x in range(5):
+            self.fifo.put(x)
+        self.assertEqual(self.fifo.get_batch(3), [0, 1, 2])
+        self.assertEqual(self.fifo.get_batch(3), [3, 4])
+        self.assertTrue(self.fifo.empty())
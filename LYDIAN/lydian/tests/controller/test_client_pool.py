@@ -0,0 +1,170 @@
+#!/usr/bin/env python
+# Copyright (c) 2020-2021 VMware, Inc. All Rights Reserved.
+# SPDX-License-Identifier: BSD-2 License
+# The full license information can be found in LICENSE.txt
+# in the root directory of this project.
+
+import unittest
+from unittest import mock
+
+import lydian.controller.client as client_module
+from lydian.controller.client import LydianClientPool
+
+
+class FakeClient(object):
+    """ Stands in for LydianClient, without any connection. """
+    instances = []
+
+    def __init__(self, host):
+        self.host = host
+        self.connected = False
+        self.closed = False
+        FakeClient.instances.append(self)
+
+    def connect(self):
+        self.connected = True
+
+    def close(self):
+        self.connected = False
+        self.closed = True
+
+
+class LydianClientPoolTest(unittest.TestCase):
+
+    def setUp(self):
+        FakeClient.instances = []
+        patcher = mock.patch.object(client_module, 'LydianClient',
+                                    FakeClient)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.pool = LydianClientPool(idle_timeout=60, max_host_connections=2)
+        self.addCleanup(self.pool.close)
+
+    def test_reuse(self):
+        with self.pool.get('host1') as c1:
+            pass
+        with self.pool.get('host1') as c2:
+            pass
+        with self.pool.get('host2') as c3:
+            pass
+
+        # TEST : Idle connection is reused, one per host.
+        self.assertIs(c1, c2)
+        self.assertIsNot(c1, c3)
+        self.assertEqual(len(FakeClient.instances), 2)
+        assert not any(c.closed for c in FakeClient.instances)
+
+    def test_busy_connection(self):
+        with self.pool.get('host1') as c1:
+            # TEST : New connection is made while the other one is busy.
+            with self.pool.get('host1') as c2:
+                self.assertIsNot(c1, c2)
+                # TEST : Least busy is shared, once at max connections.
+                with self.pool.get('host1') as c3:
+                    self.assertIn(c3, (c1, c2))
+        self.assertEqual(len(FakeClient.instances), 2)
+
+    def test_broken_connection(self):
+        for err in (EOFError, OSError):
+            with self.assertRaises(err):
+                with self.pool.get('host1') as client:
+                    raise err()
+
+            # TEST : Broken connection is closed and not reused.
+            self.assertTrue(client.closed)
+            with self.pool.get('host1') as new_client:
+                self.assertIsNot(new_client, client)
+
+    def test_broken_in_use(self):
+        pool = LydianClientPool(max_host_connections=1)
+        self.addCleanup(pool.close)
+        with pool.get('host1') as c1:
+            with self.assertRaises(EOFError):
+                with pool.get('host1') as c2:
+                    self.assertIs(c1, c2)
+                    raise EOFError()
+
+            # TEST : Still in use by the outer block, so not closed yet.
+            self.assertFalse(c1.closed)
+            # ... but no more handed out.
+            with pool.get('host1') as c3:
+                self.assertIsNot(c3, c1)
+
+        # TEST : Closed upon the last release.
+        self.assertTrue(c1.closed)
+        self.assertFalse(c3.closed)
+
+    def test_call_retry(self):
+        calls = []
+
+        def func(client, val):
+            calls.append(client)
+            if len(calls) == 1:
+                raise EOFError()    # stale connection.
+            return val
+
+        # TEST : Connection from cache is retried on a new one.
+        stale = self.pool.call('host1', lambda client: client)
+        self.assertEqual(self.pool.call('host1', func, 10), 10)
+        self.assertIs(calls[0], stale)
+        self.assertTrue(stale.closed)
+        self.assertIsNot(calls[1], stale)
+
+        # TEST : New connection is not retried.
+        self.pool.discard()
+        calls[:] = []
+        self.assertRaises(EOFError, self.pool.call, 'host1', func, 10)
+        self.assertEqual(len(calls), 1)
+
+        # TEST : Other errors are not retried.
+        def fail(client):
+            calls.append(client)
+            raise ValueError()
+        calls[:] = []
+        self.assertRaises(ValueError, self.pool.call, 'host1', fail)
+        self.assertEqual(len(calls), 1)
+        self.assertFalse(calls[0].closed)
+
+    def test_close_idle(self):
+        with self.pool.get('host1') as c1:
+            pass
+        with self.pool.get('host2') as c2:
+            # TEST : Recently used and in use connections are kept.
+            self.pool.close_idle()
+            self.assertFalse(c1.closed)
+
+            with mock.patch.object(client_module.time, 'time',
+                                   return_value=10 ** 10):
+                self.pool.close_idle()
+            self.assertTrue(c1.closed)
+            self.assertFalse(c2.closed)
+
+    def test_discard(self):
+        clients = {}
+        for host in ('host1', 'host2', 'host3'):
+            with self.pool.get(host) as client:
+                clients[host] = client
+
+        self.pool.discard(['host1'])
+        self.assertTrue(clients['host1'].closed)
+        self.assertFalse(clients['host2'].closed)
+
+        # TEST : Discarded host gets a new connection.
+        with self.pool.get('host1') as client:
+            self.assertIsNot(client, clients['host1'])
+
+            # TEST : All idle connections are closed if no hosts given,
+            # in use ones upon release.
+            self.pool.discard()
+            self.assertFalse(client.closed)
+        self.assertTrue(all(c.closed for c in FakeClient.instances))
+
+    def test_reaper(self):
+        # TEST : Reaper starts upon use, and again after close.
+        self.assertTrue(self.pool.stopped)
+        for _ in range(2):
+            with self.pool.get('host1'):
+                pass
+            self.assertFalse(self.pool.stopped)
+            self.pool.close()
+            self.assertTrue(self.pool.stopped)
@@ -12,17 +12,18 @@ A simple test case for sending traffic.
 
 import logging
 import os
-import pickle
-import queue
 import time
 import unittest
 import uuid
 
+import msgpack
+
 from lydian.apps.monitor import ResourceMonitor
 from lydian.apps.rules import RulesApp
 from lydian.apps.recorder import RecordManager
 from lydian.apps.results import Results
 from lydian.apps.traffic_controller import TrafficControllerApp
+from lydian.common.fifo import CircularFifoQueue
 from lydian.recorder.wf_client import WavefrontTrafficRecorder, WavefrontResourceRecorder
 from lydian.utils.network_utils import NamespaceManager, InterfaceManager
 from lydian.utils.logger import setup_logging
@@ -51,11 +52,15 @@ class TrafficAppTest(unittest.TestCase):
         self._delete_db_files()
 
         # Traffic Records.
-        self.traffic_records = getattr(self, 'traffic_records',
-                                       queue.Queue(self.MAX_QUEUE_SIZE))
+        self.traffic_records = getattr(
+            self, 'traffic_records',
+            CircularFifoQueue(self.MAX_QUEUE_SIZE,
+                              mode=CircularFifoQueue.OVERWRITE))
         # Resource records.
-        self.resource_records = getattr(self, 'resource_records',
-                                        queue.Queue(self.MAX_QUEUE_SIZE))
+        self.resource_records = getattr(
+            self, 'resource_records',
+            CircularFifoQueue(self.MAX_QUEUE_SIZE,
+                              mode=CircularFifoQueue.OVERWRITE))
 
         self.rulesApp = RulesApp(db_file=self.DB_FILE)
         traffic_tools = getattr(self, 'traffic_tools', {})
@@ -120,14 +125,14 @@ class TrafficAppTest(unittest.TestCase):
         records = self.results.traffic(reqid=self.reqid,
                                        ruleid=ruleid,
                                        timestamp=(ts-8, ts))
-        assert not pickle.loads(records), "Stop traffic not working..."
+        assert not msgpack.unpackb(records)['rows'], "Stop traffic not working..."
         self.controller.start(ruleid)
         time.sleep(10)  # Stop traffic for 10 seconds
         ts = int(time.time())
         records = self.results.traffic(reqid=self.reqid,
                                        ruleid=ruleid,
                                        timestamp=(ts-8, ts))
-        assert pickle.loads(records), "Start traffic not working..."
+        assert msgpack.unpackb(records)['rows'], "Start traffic not working..."
 
     def _test_persistence(self):
         self.controller.close()
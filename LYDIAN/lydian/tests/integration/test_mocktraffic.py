@@ -11,10 +11,10 @@ A simple test case for sending traffic.
 '''
 
 import logging
-import queue
 import uuid
 
 from lydian.apps.mocktraffic import MockTraffic
+from lydian.common.fifo import CircularFifoQueue
 from lydian.tests.integration.test_lydian import TrafficAppTest
 
 log = logging.getLogger(__name__)
@@ -36,7 +36,8 @@ class MockTrafficTest(TrafficAppTest):
     }
 
     def setUp(self):
-        self.traffic_records = queue.Queue(self.MAX_QUEUE_SIZE)
+        self.traffic_records = CircularFifoQueue(
+            self.MAX_QUEUE_SIZE, mode=CircularFifoQueue.OVERWRITE)
         self.mocktraffic = MockTraffic(self.traffic_records)
         self.mocktraffic.start()
         self.traffic_tools = {'mock': self.mocktraffic}
@@ -0,0 +1,35 @@
+#!/usr/bin/env python
+# Copyright (c) 2020-2021 VMware, Inc. All Rights Reserved.
+# SPDX-License-Identifier: BSD-2 License
+# The full license information can be found in LICENSE.txt
+# in the root directory of this project.
+
+import unittest
+
+from lydian.traffic.core import TrafficRecord, TrafficRecordPool
+
+
+class TrafficRecordPoolTest(unittest.TestCase):
+
+    def test_acquire_release(self):
+        pool = TrafficRecordPool(capacity=2)
+
+        rec = pool.acquire()
+        assert isinstance(rec, TrafficRecord)
+        rec.reqid = 'dummy'
+        rec.result = True
+        pool.release(rec)
+
+        # Released record is reused after being reset.
+        _rec = pool.acquire()
+        self.assertIs(_rec, rec)
+        self.assertIsNone(_rec.reqid)
+        self.assertIsNone(_rec.result)
+
+        # Pool doesn't retain records beyond its capacity.
+        recs = [pool.acquire() for _ in range(3)]
+        for rec in recs:
+            pool.release(rec)
+        reused = [pool.acquire() for _ in range(2)]
+        self.assertEqual(set(map(id, reused)), set(map(id, recs[:2])))
+        self.assertNotIn(pool.acquire(), recs)
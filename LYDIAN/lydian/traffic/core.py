@@ -3,12 +3,15 @@
 # SPDX-License-Identifier: BSD-2 License
 # The full license information can be found in LICENSE.txt
 # in the root directory of this project.
+import collections
 import json
 import logging
 import time
 
 log = logging.getLogger(__name__)
 
+_record_pool = None
+
 
 class Target(object):
     POSIX = 'POSIX'
@@ -186,3 +189,40 @@ class TrafficRecord(Record):
         self.error = None           # Error Type, if any
         self.reqid = None           # Request ID
         self.ruleid = None          # Rule ID
+
+    def reset(self):
+        """ Clears all the fields (and timestamp) for reusing the record. """
+        self.__init__()
+
+
+class TrafficRecordPool(object):
+    CAPACITY = 100000   # max number of free records retained.
+
+    def __init__(self, capacity=None):
+        """
+        Pool of reusable Traffic Records. Producers acquire() records
+        and consumer release() them once written to all the recorders.
+        A new record is created when pool runs out of free records.
+        """
+        self._capacity = capacity or self.CAPACITY
+        self._free = collections.deque()
+
+    def acquire(self):
+        try:
+            rec = self._free.pop()
+        except IndexError:
+            return TrafficRecord()
+        rec.reset()
+        return rec
+
+    def release(self, rec):
+        if len(self._free) < self._capacity:
+            self._free.append(rec)
+
+
+def get_record_pool():
+    global _record_pool
+    if not _record_pool:
+        _record_pool = TrafficRecordPool()
+
+    return _record_pool
@@ -6,11 +6,10 @@
 
 import logging
 import os
-import queue
 import threading
 
 from lydian.apps import config as config
-from lydian.traffic.core import TrafficRecord
+from lydian.traffic.core import get_record_pool
 from lydian.traffic.client import TCPClient, UDPClient, HTTPClient
 from lydian.traffic.server import TCPServer, UDPServer, HTTPServer
 from lydian.utils.common import is_ipv6_address, is_linux
@@ -156,24 +155,23 @@ class TrafficClientTask(TrafficTask):
         self._task = next(self._ns_task_iter)
 
     def ping_handler(self, payload, data, latency, error=None):
-        try:
-            rec = TrafficRecord()
-            rec.source = self._trule.src
-            rec.destination = self._trule.dst
-            rec.protocol = self._trule.protocol
-            rec.port = self._trule.port
-            rec.expected = self._trule.connected in [1, '1']
-            rec.result = not rec.expected ^ (data == payload)
-            rec.reqid = self._trule.reqid
-            rec.ruleid = self._trule.ruleid
-            rec.latency = latency
-            if not rec.result:
-                rec.error = '%s' % error
-            # log.info("Traffic: %r", rec)
-            self.record_queue.put(rec, block=False, timeout=2)
-        except queue.Full as err:
-            log.error("Cann't put Traffic Record %r into the queue: %r",
-                      rec, err)
+        if not self.record_queue.accepting:
+            return      # All the recorders are disabled.
+        rec = get_record_pool().acquire()
+        rec.source = self._trule.src
+        rec.destination = self._trule.dst
+        rec.protocol = self._trule.protocol
+        rec.port = self._trule.port
+        rec.expected = self._trule.connected in [1, '1']
+        rec.result = not rec.expected ^ (data == payload)
+        rec.reqid = self._trule.reqid
+        rec.ruleid = self._trule.ruleid
+        rec.latency = latency
+        if not rec.result:
+            rec.error = '%s' % error
+        # log.info("Traffic: %r", rec)
+        # Drops the oldest record, if queue is full.
+        self.record_queue.put(rec)
 
 
 class TrafficServerTask(TrafficTask):
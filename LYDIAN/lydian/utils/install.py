@@ -126,6 +126,7 @@ def install_egg():
         # Pack Lydian dependency packages.
         z.add_module('rpyc')
         z.add_module('sql30')
+        z.add_module('msgpack')
 
         # Pack Lydian Source
         z.add_dir(dirname=lydian_path, atroot="./lydian/")
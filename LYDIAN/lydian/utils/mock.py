@@ -24,9 +24,14 @@ class DeadNode(object):
         pass
 
 class DummyWaveFrontWriter(DeadNode):
+    enabled = False
+
     def write(self, rec):
         pass
 
+    def write_many(self, recs):
+        pass
+
 WavefrontTrafficRecorder = DummyWaveFrontWriter
 
 WavefrontResourceRecorder = DummyWaveFrontWriter
@@ -44,12 +49,17 @@ WavefrontDirectClient = WavefrontDeadClient
 WavefrontProxyClient = WavefrontDeadClient
 
 class DummyElasticSearchWriter(DeadNode):
+    enabled = False
+
     def send(self, data):
         pass
 
     def write(self, rec):
         pass
 
+    def write_many(self, recs):
+        pass
+
 ElasticSearchTrafficRecorder = DummyElasticSearchWriter
 
 class ElasticsearchDeadClient(DeadNode):
@@ -15,23 +15,36 @@ log = logging.getLogger(__name__)
 THREAD_COUNT = get_param('DEFAULT_CONCURRENCY', 32)
 
 
-def ThreadPool(func, params, timeout=None, blocking=True, workers=None):
+def _run_tasks(tpool, func, params, blocking):
     results = {}
-    max_workers = workers or THREAD_COUNT
+    futures = {}
+    for _ident, _args, _kwargs in params:
+        _tfunc = tpool.submit(func, *_args, **_kwargs)
+        futures[_tfunc] = _ident
+
+    if not blocking:
+        return None
+
+    for future in as_completed(futures):
+        ident = futures[future]
+        try:
+            results[ident] = future.result()
+        except Exception as err:
+            log.warn("Error for %s - %s", ident, err)
+    return results
+
 
+def ThreadPool(func, params, timeout=None, blocking=True, workers=None,
+               executor=None):
+    """
+    Runs func for each of (ident, args, kwargs) in params concurrently and
+    returns results as a dictionary of <ident: result>. Tasks are run in
+    executor, if provided, else in a pool of threads created for this
+    call.
+    """
+    if executor:
+        return _run_tasks(executor, func, params, blocking)
+
+    max_workers = workers or THREAD_COUNT
     with ThreadPoolExecutor(max_workers=max_workers) as tpool:
-        futures = {}
-        for _ident, _args, _kwargs in params:
-            _tfunc = tpool.submit(func, *_args, **_kwargs)
-            futures[_tfunc] = _ident
-
-        if not blocking:
-            return None
-
-        for future in as_completed(futures):
-            ident = futures[future]
-            try:
-                results[ident] = future.result()
-            except Exception as err:
-                log.warn("Error for %s - %s", ident, err)
-    return results
+        return _run_tasks(tpool, func, params, blocking)
@@ -4,4 +4,6 @@
 # The full license information can be found in LICENSE.txt
 # in the root directory of this project.
 python -m unittest discover -p test_background.py lydian/tests/common
+python -m unittest discover -p test_fifo.py lydian/tests/common
 python -m unittest discover -p test_mocktraffic.py lydian/tests/integration
+python -m unittest discover -p test_client_pool.py lydian/tests/controller